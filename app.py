@@ -2,7 +2,22 @@
 
 from flask import Flask
 
-app = Flask(__name__)
+
+def create_app() -> Flask:
+    """Create and configure the Flask application.
+
+    Production deployments serve the returned app through gunicorn instead
+    of the Werkzeug development server, e.g.
+    ``gunicorn -k gthread -w 2 --threads 8 -b 0.0.0.0:5000 'app:create_app()'``.
+    """
+    app = Flask(__name__)
+    # Responses are consumed by pollers and devices, not humans: skip
+    # sorting keys on every jsonify call.
+    app.json.sort_keys = False
+    return app
+
+
+app = create_app()
 
 first_request = True
 